@@ -35,7 +35,7 @@ def create_mcp(service: DictionaryService, logger: logging.Logger) -> FastMCP:
         words: Annotated[list[str], Field(min_length=1, max_length=10)],
         dict_type: DictType = "ko-zh",
     ) -> SearchResponse:
-        started_at = time.monotonic()
+        started_at = time.perf_counter_ns()
         result = await service.search_words(words, dict_type)
         logger.info(
             "dictionary_search_completed",
@@ -44,7 +44,7 @@ def create_mcp(service: DictionaryService, logger: logging.Logger) -> FastMCP:
                 "word_count": len(words),
                 "succeeded": result.summary.succeeded,
                 "failed": result.summary.failed,
-                "duration_ms": round((time.monotonic() - started_at) * 1000, 2),
+                "duration_ms": round((time.perf_counter_ns() - started_at) / 1_000_000, 2),
             },
         )
         return result
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncIterator, Mapping
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from types import MappingProxyType
 from typing import Any, Final, Protocol, cast
 
 import httpx
+from pydantic_core import from_json
 
 from src.config import Settings
 from src.models import DictionaryEntry, DictType, ErrorCode
@@ -40,9 +41,15 @@ class DictionaryGatewayFactory(Protocol):
 class NaverDictionaryGateway:
     """Concrete gateway backed by an injected request-scoped HTTP client."""
 
-    def __init__(self, client: httpx.AsyncClient, settings: Settings) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        settings: Settings,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
         self._client = client
         self._settings = settings
+        self._sleep = sleep
 
     async def search(self, word: str, dict_type: DictType) -> tuple[DictionaryEntry, ...]:
         dict_code, language = DICT_CODE_MAP[dict_type]
@@ -58,7 +65,7 @@ class NaverDictionaryGateway:
             try:
                 response = await self._client.get(url, params=params)
                 response.raise_for_status()
-                payload = response.json()
+                payload = from_json(response.content)
                 if not isinstance(payload, Mapping):
                     raise DictionaryError(
                         "invalid_upstream_payload", "Naver 返回了无效的 JSON 结构"
@@ -95,7 +102,7 @@ class NaverDictionaryGateway:
                 self._settings.retry_max_delay_seconds,
                 self._settings.retry_base_delay_seconds * (2 ** (attempt - 1)),
             )
-            await asyncio.sleep(delay)
+            await self._sleep(delay)
 
         raise RuntimeError("unreachable retry state")
 
@@ -103,8 +110,11 @@ class NaverDictionaryGateway:
 class NaverGatewayFactory:
     """Create one HTTP client and gateway per MCP tool invocation."""
 
-    def __init__(self, settings: Settings) -> None:
+    def __init__(
+        self, settings: Settings, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
         self._settings = settings
+        self._transport = transport
 
     def __call__(self) -> AbstractAsyncContextManager[DictionaryGateway]:
         return self._create()
@@ -120,5 +130,6 @@ class NaverGatewayFactory:
             timeout=httpx.Timeout(self._settings.http_timeout_seconds),
             follow_redirects=True,
             headers=headers,
+            transport=self._transport,
         ) as client:
             yield NaverDictionaryGateway(client, self._settings)
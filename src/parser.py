@@ -44,6 +44,8 @@ def clean_html(text: object) -> str:
     raw = _string(text)
     if not raw:
         return ""
+    if "<" not in raw and "&" not in raw:
+        return raw.strip()
     without_autolink = _AUTOLINK_PATTERN.sub(r"\1", raw)
     decoded = html.unescape(without_autolink)
     return _HTML_TAG_PATTERN.sub("", decoded).strip()
@@ -52,8 +54,8 @@ def clean_html(text: object) -> str:
 def extract_related_words(text: object) -> tuple[str, ...]:
     """Extract related-word spans while preserving source order."""
 
-    matches = _RELATED_WORD_PATTERN.findall(_string(text))
-    return _dedupe(tuple(clean_html(match) for match in matches if clean_html(match)))
+    cleaned = (clean_html(match) for match in _RELATED_WORD_PATTERN.findall(_string(text)))
+    return _dedupe(tuple(word for word in cleaned if word))
 
 
 def _extract_meanings(collectors: Sequence[object], source: SourceType) -> tuple[Meaning, ...]:
@@ -22,6 +22,11 @@ MAX_WORDS_PER_REQUEST = 10
 MAX_WORD_LENGTH = 100
 type LookupResult = tuple[DictionaryEntry, ...] | SearchError
 
+_EMPTY_WORD_ERROR = SearchError(code="validation_error", message="搜索词不能为空")
+_WORD_TOO_LONG_ERROR = SearchError(
+    code="validation_error", message=f"搜索词不能超过 {MAX_WORD_LENGTH} 个字符"
+)
+
 
 class InputValidationError(ValueError):
     """Raised when the request itself cannot be processed."""
@@ -44,7 +49,7 @@ def normalize_word(word: str, index: int) -> NormalizedWord:
             index=index,
             original=word,
             normalized=None,
-            error=SearchError(code="validation_error", message="搜索词不能为空"),
+            error=_EMPTY_WORD_ERROR,
         )
     normalized = unicodedata.normalize("NFC", stripped)
     if len(normalized) > MAX_WORD_LENGTH:
@@ -52,9 +57,7 @@ def normalize_word(word: str, index: int) -> NormalizedWord:
             index=index,
             original=word,
             normalized=None,
-            error=SearchError(
-                code="validation_error", message=f"搜索词不能超过 {MAX_WORD_LENGTH} 个字符"
-            ),
+            error=_WORD_TOO_LONG_ERROR,
         )
     return NormalizedWord(index=index, original=word, normalized=normalized, error=None)
 
@@ -12,7 +12,7 @@ from src.client import DictionaryGateway
 from src.models import DictionaryEntry, DictType, Meaning
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_api_response() -> dict[str, Any]:
     return {
         "searchResultMap": {
@@ -42,7 +42,7 @@ def sample_api_response() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_entry() -> DictionaryEntry:
     return DictionaryEntry(
         word="안녕하세요",
@@ -78,3 +78,13 @@ class StubGatewayFactory:
     async def _open(self) -> AsyncIterator[DictionaryGateway]:
         self.open_count += 1
         yield self.gateway
+
+
+@pytest.fixture
+def stub_gateway(sample_entry: DictionaryEntry) -> StubGateway:
+    return StubGateway((sample_entry,))
+
+
+@pytest.fixture
+def stub_gateway_factory(stub_gateway: StubGateway) -> StubGatewayFactory:
+    return StubGatewayFactory(stub_gateway)
@@ -11,19 +11,19 @@ from starlette.testclient import TestClient
 
 from src.application import create_app
 from src.config import Settings
-from src.models import DictionaryEntry
-from tests.conftest import StubGateway, StubGatewayFactory
+from tests.conftest import StubGatewayFactory
 
 VALID_KEY = "a" * 32
 
 
-def build_app(sample_entry: DictionaryEntry) -> Starlette:
-    gateway = StubGateway((sample_entry,))
-    return create_app(Settings(mcp_api_key=VALID_KEY), StubGatewayFactory(gateway))
+def build_app(gateway_factory: StubGatewayFactory) -> Starlette:
+    return create_app(Settings(mcp_api_key=VALID_KEY), gateway_factory)
 
 
-def test_public_routes_do_not_require_authentication(sample_entry: DictionaryEntry) -> None:
-    with TestClient(build_app(sample_entry)) as client:
+def test_public_routes_do_not_require_authentication(
+    stub_gateway_factory: StubGatewayFactory,
+) -> None:
+    with TestClient(build_app(stub_gateway_factory)) as client:
         assert client.get("/").json() == {
             "service": "naver-dictionary-mcp",
             "status": "ok",
@@ -32,8 +32,8 @@ def test_public_routes_do_not_require_authentication(sample_entry: DictionaryEnt
         assert client.get("/health").json() == {"status": "ok"}
 
 
-def test_mcp_requires_exact_bearer_token(sample_entry: DictionaryEntry) -> None:
-    with TestClient(build_app(sample_entry)) as client:
+def test_mcp_requires_exact_bearer_token(stub_gateway_factory: StubGatewayFactory) -> None:
+    with TestClient(build_app(stub_gateway_factory)) as client:
         for headers in ({}, {"Authorization": "Bearer wrong"}):
             response = client.post("/mcp", headers=headers, json={})
             assert response.status_code == 401
@@ -41,7 +41,7 @@ def test_mcp_requires_exact_bearer_token(sample_entry: DictionaryEntry) -> None:
             assert response.headers["www-authenticate"] == "Bearer"
 
 
-def test_valid_token_reaches_mcp_initialize(sample_entry: DictionaryEntry) -> None:
+def test_valid_token_reaches_mcp_initialize(stub_gateway_factory: StubGatewayFactory) -> None:
     headers = {
         "Authorization": f"Bearer {VALID_KEY}",
         "Accept": "application/json, text/event-stream",
@@ -56,7 +56,7 @@ def test_valid_token_reaches_mcp_initialize(sample_entry: DictionaryEntry) -> No
             "clientInfo": {"name": "pytest", "version": "1"},
         },
     }
-    with TestClient(build_app(sample_entry)) as client:
+    with TestClient(build_app(stub_gateway_factory)) as client:
         response = client.post("/mcp", headers=headers, json=payload)
 
     assert response.status_code == 200
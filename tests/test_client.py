@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+from types import TracebackType
+from typing import Any, Self
 
 import httpx
 import pytest
 
-from src.client import DictionaryError, NaverDictionaryGateway
+from src.client import (
+    DictionaryError,
+    DictionaryGateway,
+    NaverDictionaryGateway,
+    NaverGatewayFactory,
+)
 from src.config import Settings
 
 VALID_KEY = "a" * 32
@@ -23,7 +31,10 @@ def make_settings(**overrides: Any) -> Settings:
     )
 
 
-@pytest.mark.asyncio
+def open_gateway(transport: httpx.MockTransport) -> AbstractAsyncContextManager[DictionaryGateway]:
+    return NaverGatewayFactory(make_settings(), transport=transport)()
+
+
 async def test_search_builds_expected_naver_request(sample_api_response: dict[str, Any]) -> None:
     async def handler(request: httpx.Request) -> httpx.Response:
         assert request.url.path == "/api3/kozh/search"
@@ -31,14 +42,52 @@ async def test_search_builds_expected_naver_request(sample_api_response: dict[st
         assert request.url.params["lang"] == "zh_CN"
         return httpx.Response(200, json=sample_api_response)
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         entries = await gateway.search("안녕", "ko-zh")
 
     assert entries[0].word == "안녕하세요"
 
 
-@pytest.mark.asyncio
+class LifecycleCountingTransport(httpx.MockTransport):
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response]) -> None:
+        super().__init__(handler)
+        self.open_count = 0
+        self.close_count = 0
+
+    async def __aenter__(self) -> Self:
+        self.open_count += 1
+        return await super().__aenter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        self.close_count += 1
+        await super().__aexit__(exc_type, exc_value, traceback)
+
+
+async def test_factory_shares_one_client_per_invocation(
+    sample_api_response: dict[str, Any],
+) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=sample_api_response)
+
+    transport = LifecycleCountingTransport(handler)
+    async with open_gateway(transport) as gateway:
+        await gateway.search("안녕", "ko-zh")
+        await gateway.search("학교", "ko-en")
+        assert (transport.open_count, transport.close_count) == (1, 0)
+
+    assert (transport.open_count, transport.close_count) == (1, 1)
+    assert [request.url.params["query"] for request in requests] == ["안녕", "학교"]
+    assert all(request.headers["User-Agent"].startswith("naver-dict-mcp/") for request in requests)
+
+
 async def test_retryable_status_is_retried(sample_api_response: dict[str, Any]) -> None:
     call_count = 0
 
@@ -49,14 +98,35 @@ async def test_retryable_status_is_retried(sample_api_response: dict[str, Any])
             return httpx.Response(503, text="unavailable")
         return httpx.Response(200, json=sample_api_response)
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         await gateway.search("안녕", "ko-zh")
 
     assert call_count == 2
 
 
-@pytest.mark.asyncio
+async def test_retry_sleeps_base_delay_through_injected_sleep() -> None:
+    delays: list[float] = []
+
+    async def record_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503, text="unavailable")
+
+    settings = Settings(
+        mcp_api_key=VALID_KEY,
+        naver_base_url="https://naver.test/api3",
+        retry_base_delay_seconds=0.2,
+        retry_max_delay_seconds=1.0,
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        gateway = NaverDictionaryGateway(client, settings, sleep=record_sleep)
+        with pytest.raises(DictionaryError):
+            await gateway.search("안녕", "ko-zh")
+
+    assert delays == [0.2]
+
+
 @pytest.mark.parametrize(
     ("status_code", "expected_code"),
     [
@@ -69,15 +139,13 @@ async def test_http_failures_have_stable_codes(status_code: int, expected_code:
     async def handler(_request: httpx.Request) -> httpx.Response:
         return httpx.Response(status_code, text="failure")
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         with pytest.raises(DictionaryError) as captured:
             await gateway.search("안녕", "ko-en")
 
     assert captured.value.code == expected_code
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("exception", "expected_code"),
     [
@@ -92,15 +160,13 @@ async def test_transport_failures_have_stable_codes(
         exception.request = request
         raise exception
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         with pytest.raises(DictionaryError) as captured:
             await gateway.search("안녕", "ko-zh")
 
     assert captured.value.code == expected_code
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     "response",
     [httpx.Response(200, json=["not", "an", "object"]), httpx.Response(200, text="not-json")],
@@ -109,20 +175,17 @@ async def test_invalid_payload_is_explicit(response: httpx.Response) -> None:
     async def handler(_request: httpx.Request) -> httpx.Response:
         return response
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         with pytest.raises(DictionaryError) as captured:
             await gateway.search("안녕", "ko-zh")
 
     assert captured.value.code == "invalid_upstream_payload"
 
 
-@pytest.mark.asyncio
 async def test_unexpected_failure_is_not_swallowed() -> None:
     async def handler(_request: httpx.Request) -> httpx.Response:
         raise RuntimeError("programming error")
 
-    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
-        gateway = NaverDictionaryGateway(client, make_settings())
+    async with open_gateway(httpx.MockTransport(handler)) as gateway:
         with pytest.raises(RuntimeError, match="programming error"):
             await gateway.search("안녕", "ko-zh")
@@ -10,6 +10,15 @@ def test_clean_html_handles_entities_and_naver_links() -> None:
     assert clean_html(value) == "使 用"
 
 
+def test_clean_html_strips_plain_text_and_still_decodes_entities() -> None:
+    assert clean_html("  你好  ") == "你好"
+    assert clean_html("a &amp; b") == "a & b"
+    assert clean_html("&#54620;국") == "한국"
+    assert clean_html("a & b") == "a & b"
+    assert clean_html("1 < 2") == "1 < 2"
+    assert clean_html(None) == ""
+
+
 def test_extract_related_words_deduplicates_in_order() -> None:
     value = (
         '<span class="related_word" lang="ko">시험</span>'
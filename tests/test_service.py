@@ -1,11 +1,12 @@
 """Tests for batch search business behavior."""
 
+import asyncio
 import unicodedata
 
 import pytest
 
 from src.client import DictionaryError
-from src.models import DictionaryEntry
+from src.models import DictionaryEntry, DictType
 from src.service import DictionaryService, InputValidationError, normalize_word
 from tests.conftest import StubGateway, StubGatewayFactory
 
@@ -17,13 +18,10 @@ def test_normalize_word_uses_nfc_and_reports_item_errors() -> None:
     assert normalize_word("가" * 101, 2).error.code == "validation_error"  # type: ignore[union-attr]
 
 
-@pytest.mark.asyncio
 async def test_search_preserves_order_and_deduplicates(
-    sample_entry: DictionaryEntry,
+    stub_gateway: StubGateway, stub_gateway_factory: StubGatewayFactory
 ) -> None:
-    gateway = StubGateway((sample_entry,))
-    factory = StubGatewayFactory(gateway)
-    service = DictionaryService(factory, concurrency=5)
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
 
     response = await service.search_words([" 안녕하세요 ", "", "안녕하세요"], "ko-zh")
 
@@ -32,27 +30,68 @@ async def test_search_preserves_order_and_deduplicates(
     assert response.items[0].success is True
     assert response.items[1].success is False
     assert response.items[2].success is True
-    assert gateway.calls == [("안녕하세요", "ko-zh")]
-    assert factory.open_count == 1
+    assert stub_gateway.calls == [("안녕하세요", "ko-zh")]
+    assert stub_gateway_factory.open_count == 1
+
+
+async def test_distinct_words_share_one_gateway(
+    stub_gateway: StubGateway, stub_gateway_factory: StubGatewayFactory
+) -> None:
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
+
+    await service.search_words(["학교", "사랑", "시험"], "ko-en")
+
+    assert sorted(stub_gateway.calls) == sorted(
+        [("학교", "ko-en"), ("사랑", "ko-en"), ("시험", "ko-en")]
+    )
+    assert stub_gateway_factory.open_count == 1
+
+
+class ConcurrencyProbeGateway(StubGateway):
+    def __init__(self, result: tuple[DictionaryEntry, ...]) -> None:
+        super().__init__(result)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def search(self, word: str, dict_type: DictType) -> tuple[DictionaryEntry, ...]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            return await super().search(word, dict_type)
+        finally:
+            self.in_flight -= 1
 
 
-@pytest.mark.asyncio
-async def test_all_invalid_items_do_not_open_gateway(sample_entry: DictionaryEntry) -> None:
-    gateway = StubGateway((sample_entry,))
-    factory = StubGatewayFactory(gateway)
-    service = DictionaryService(factory, concurrency=5)
+async def test_upstream_lookups_are_bounded_by_concurrency(
+    sample_entry: DictionaryEntry,
+) -> None:
+    gateway = ConcurrencyProbeGateway((sample_entry,))
+    service = DictionaryService(StubGatewayFactory(gateway), concurrency=2)
+
+    response = await service.search_words([f"단어{index}" for index in range(10)], "ko-zh")
+
+    assert response.summary.succeeded == 10
+    assert len(gateway.calls) == 10
+    assert gateway.max_in_flight == 2
+
+
+async def test_all_invalid_items_do_not_open_gateway(
+    stub_gateway_factory: StubGatewayFactory,
+) -> None:
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
 
     response = await service.search_words(["", " "], "ko-en")
 
     assert response.summary.failed == 2
-    assert factory.open_count == 0
+    assert stub_gateway_factory.open_count == 0
 
 
-@pytest.mark.asyncio
-async def test_known_gateway_error_is_item_failure(sample_entry: DictionaryEntry) -> None:
-    gateway = StubGateway((sample_entry,))
-    gateway.exception = DictionaryError("timeout", "Naver 请求超时")
-    service = DictionaryService(StubGatewayFactory(gateway), concurrency=5)
+async def test_known_gateway_error_is_item_failure(
+    stub_gateway: StubGateway, stub_gateway_factory: StubGatewayFactory
+) -> None:
+    stub_gateway.exception = DictionaryError("timeout", "Naver 请求超时")
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
 
     response = await service.search_words(["학교"], "ko-zh")
 
@@ -62,21 +101,20 @@ async def test_known_gateway_error_is_item_failure(sample_entry: DictionaryEntry
     assert failure.error.code == "timeout"
 
 
-@pytest.mark.asyncio
-async def test_unexpected_gateway_error_propagates(sample_entry: DictionaryEntry) -> None:
-    gateway = StubGateway((sample_entry,))
-    gateway.exception = RuntimeError("broken parser")
-    service = DictionaryService(StubGatewayFactory(gateway), concurrency=5)
+async def test_unexpected_gateway_error_propagates(
+    stub_gateway: StubGateway, stub_gateway_factory: StubGatewayFactory
+) -> None:
+    stub_gateway.exception = RuntimeError("broken parser")
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
 
     with pytest.raises(RuntimeError, match="broken parser"):
         await service.search_words(["학교"], "ko-zh")
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("words", [[], [str(index) for index in range(11)]])
 async def test_request_bounds_are_business_invariants(
-    sample_entry: DictionaryEntry, words: list[str]
+    stub_gateway_factory: StubGatewayFactory, words: list[str]
 ) -> None:
-    service = DictionaryService(StubGatewayFactory(StubGateway((sample_entry,))), concurrency=5)
+    service = DictionaryService(stub_gateway_factory, concurrency=5)
     with pytest.raises(InputValidationError):
         await service.search_words(words, "ko-zh")